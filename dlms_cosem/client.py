@@ -14,6 +14,9 @@ from dlms_cosem.protocol.xdlms import ConfirmedServiceError
 
 LOG = structlog.get_logger()
 
+# GET responses that hold the last (or only) part of the requested data.
+_LAST_GET_RESPONSES = (xdlms.GetResponseNormal, xdlms.GetResponseLastBlock)
+
 
 class DataResultError(Exception):
     """ Error retrieveing data"""
@@ -81,38 +84,34 @@ class DlmsClient:
             )
         )
         all_data_received = False
-        data = bytearray()
+        # Collect the blocks and join them once all are received.
+        blocks: List[bytes] = []
         while not all_data_received:
             get_response = self.next_event()
-            if isinstance(get_response, xdlms.GetResponseNormal):
-                data.extend(get_response.data)
-                all_data_received = True
-                continue
-            if isinstance(get_response, xdlms.GetResponseWithBlock):
-                data.extend(get_response.data)
+            # The response classes don't inherit from each other so it is enough to
+            # look at the type.
+            response_type = type(get_response)
+            if response_type is xdlms.GetResponseWithBlock:
+                blocks.append(get_response.data)
                 self.send(
                     xdlms.GetRequestNext(
                         invoke_id_and_priority=get_response.invoke_id_and_priority,
                         block_number=get_response.block_number,
                     )
                 )
-                continue
-            if isinstance(get_response, xdlms.GetResponseLastBlock):
-                data.extend(get_response.data)
+            elif response_type in _LAST_GET_RESPONSES:
+                blocks.append(get_response.data)
                 all_data_received = True
-                continue
-
-            if isinstance(get_response, xdlms.GetResponseLastBlockWithError):
+            elif response_type is xdlms.GetResponseLastBlockWithError:
                 raise DataResultError(
                     f"Error in blocktransfer of GET response: {get_response.error!r}"
                 )
-
-            if isinstance(get_response, xdlms.GetResponseNormalWithError):
+            elif response_type is xdlms.GetResponseNormalWithError:
                 raise DataResultError(
                     f"Could not perform GET request: {get_response.error!r}"
                 )
 
-        return bytes(data)
+        return b"".join(blocks)
 
     def get_many(
             self, cosem_attributes_with_selection: List[cosem.CosemAttributeWithSelection]
@@ -140,10 +139,11 @@ class DlmsClient:
     def action(self, method: cosem.CosemMethod, data: bytes):
         self.send(xdlms.ActionRequestNormal(cosem_method=method, data=data))
         response = self.next_event()
+        response_type = type(response)
 
-        if isinstance(response, xdlms.ActionResponseNormalWithError):
+        if response_type is xdlms.ActionResponseNormalWithError:
             raise ActionError(response.error.name)
-        elif isinstance(response, xdlms.ActionResponseNormalWithData):
+        elif response_type is xdlms.ActionResponseNormalWithData:
             if response.status != enumerations.ActionResultStatus.SUCCESS:
                 raise ActionError(f"Unsuccessful ActionRequest: {response.status.name}")
             return response.data
@@ -162,29 +162,27 @@ class DlmsClient:
 
         self.send(aarq)
         response = self.next_event()
+        response_type = type(response)
         # we could have received an exception from the meter.
-        if isinstance(response, xdlms.ExceptionResponse):
+        if response_type is xdlms.ExceptionResponse:
             raise exceptions.DlmsClientException(
                 f"DLMS Exception: {response.state_error!r}:{response.service_error!r}"
             )
-        # the association might not be accepted by the meter
-        if isinstance(response, acse.ApplicationAssociationResponse):
-            if response.result is not enumerations.AssociationResult.ACCEPTED:
-                # there could be an error suppled with the reject.
-                extra_error = None
-                if response.user_information:
-                    if isinstance(
-                            response.user_information.content, ConfirmedServiceError
-                    ):
-                        extra_error = response.user_information.content.error
-                raise exceptions.DlmsClientException(
-                    f"Unable to perform Association: {response.result!r} and "
-                    f"{response.result_source_diagnostics!r}, extra info: {extra_error}"
-                )
-        else:
+        if response_type is not acse.ApplicationAssociationResponse:
             raise exceptions.LocalDlmsProtocolError(
                 "Did not receive an AARE after sending AARQ"
             )
+        # the association might not be accepted by the meter
+        if response.result is not enumerations.AssociationResult.ACCEPTED:
+            # there could be an error suppled with the reject.
+            extra_error = None
+            if response.user_information:
+                if type(response.user_information.content) is ConfirmedServiceError:
+                    extra_error = response.user_information.content.error
+            raise exceptions.DlmsClientException(
+                f"Unable to perform Association: {response.result!r} and "
+                f"{response.result_source_diagnostics!r}, extra info: {extra_error}"
+            )
 
         if self.should_send_hls_reply():
 
@@ -1,5 +1,8 @@
+from __future__ import annotations  # noqa
+
+import functools
 import os
-from typing import *
+from typing import Any, List, Optional, Tuple
 
 import attr
 import attrs
@@ -48,15 +51,16 @@ class XDlmsApduFactory:
         197: xdlms.SetResponseFactory,
         199: xdlms.ActionResponseFactory,
     }
+    # Tags are one byte, so the map is laid out as a table indexed by tag for a
+    # cheaper lookup on every received APDU.
+    APDU_TABLE = tuple(map(APDU_MAP.get, range(256)))
 
     @classmethod
     def apdu_from_bytes(cls, apdu_bytes):
         tag = apdu_bytes[0]
-
-        try:
-            apdu_class = cls.APDU_MAP[tag]
-        except KeyError as e:
-            raise KeyError(f"Tag {tag!r} is not available in DLMS APDU Factory") from e
+        apdu_class = cls.APDU_TABLE[tag]
+        if apdu_class is None:
+            raise KeyError(f"Tag {tag!r} is not available in DLMS APDU Factory")
         return apdu_class.from_bytes(apdu_bytes)
 
 
@@ -77,8 +81,17 @@ def make_conformance(encryption_key: Optional[bytes], use_block_transfer: bool):
     Return a default conformance with general_protection set if a
     encryption key is passed.
     """
+    return _default_conformance(bool(encryption_key))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_conformance(general_protection: bool) -> Conformance:
+    """
+    Conformance is immutable so the two possible defaults can be shared by every
+    connection.
+    """
     return Conformance(
-        general_protection=bool(encryption_key),
+        general_protection=general_protection,
         general_block_transfer=True,
         delta_value_encoding=False,
         attribute_0_supported_with_set=False,
@@ -98,6 +111,24 @@ def make_conformance(encryption_key: Optional[bytes], use_block_transfer: bool):
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _is_xdlms_apdu(apdu_type: type) -> bool:
+    """
+    AbstractXDlmsApdu is an ABC, so isinstance checks against it are slow. The
+    answer per APDU class never changes so it is looked up once.
+    """
+    return issubclass(apdu_type, AbstractXDlmsApdu)
+
+
+_ACSE_REQUESTS = (acse.ApplicationAssociationRequest, acse.ReleaseRequest)
+_ACSE_RESPONSES = (acse.ApplicationAssociationResponse, acse.ReleaseResponse)
+# Action responses that mean the meter did not accept the HLS reply.
+_FAILED_HLS_ACTION_RESPONSES = (
+    xdlms.ActionResponseNormalWithError,
+    xdlms.ActionResponseNormal,
+)
+
+
 class ProtectionError(Exception):
     """Unable to perform cryptographic function"""
 
@@ -116,7 +147,7 @@ class DlmsConnectionSettings:
     empty_system_title_in_general_glo_ciphering: bool = attr.ib(default=False)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class DlmsConnection:
     """
     A DLMS connection.
@@ -144,11 +175,10 @@ class DlmsConnection:
     # its system title
     meter_system_title: Optional[bytes] = attr.ib(default=None)
 
-    # # Meter authentication method.
-    # # TODO: this should not be set to None. Should not be optional.
-    # authentication_method: Optional[enums.AuthenticationMechanism] = attr.ib(
-    #     default=None
-    # )
+    # Authentication method the meter responded with in the AARE.
+    authentication_method: Optional[enums.AuthenticationMechanism] = attr.ib(
+        default=None, init=False
+    )
     # # Low Level Security (LLS) password
     # password: Optional[bytes] = attr.ib(default=None)
     #
@@ -196,6 +226,13 @@ class DlmsConnection:
     is_pre_established: bool = attr.ib(default=False)
 
     buffer: bytearray = attr.ib(init=False, factory=bytearray)
+    # The cipher for the global encryption key and the key it was made with.
+    _global_cipher: Optional[security.AESGCM] = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
+    _global_cipher_key: Optional[bytes] = attr.ib(
+        init=False, default=None, repr=False, eq=False
+    )
     state: dlms_state.DlmsConnectionState = attr.ib(
         factory=dlms_state.DlmsConnectionState
     )
@@ -209,7 +246,7 @@ class DlmsConnection:
         )
     )
     settings: DlmsConnectionSettings = attr.ib(
-        default=DlmsConnectionSettings(),
+        factory=DlmsConnectionSettings,
         converter=attr.converters.default_if_none(
             factory=DlmsConnectionSettings
         ))
@@ -251,11 +288,10 @@ class DlmsConnection:
         The security control field is used in encryption/decryption of data. It also
         follows the protected apdus to indicate what kind of protections they have.
         """
-        return security.SecurityControlField(
+        return security.make_security_control_field(
             self.security_suite,
-            encrypted=bool(self.global_encryption_key),
-            authenticated=bool(self.global_authentication_key),
-            broadcast_key=False,
+            bool(self.global_encryption_key),
+            bool(self.global_authentication_key),
         )
 
     def send(self, event) -> bytes:
@@ -268,15 +304,13 @@ class DlmsConnection:
             # When we are in a pre established association state starts as READY.
             # Only invalid state change is to send the ReleaseRequestApdu. But it is not
             # possible to close a pre-established association.
-            if isinstance(
-                    event, (acse.ReleaseRequest, acse.ApplicationAssociationRequest)
-            ):
+            if type(event) in _ACSE_REQUESTS:
                 raise exceptions.PreEstablishedAssociationError(
                     f"It is not allowed to send a {type(event)} when the association is"
                     f"pre-established "
                 )
 
-        if not self.settings.use_rlrq_rlre and isinstance(event, acse.ReleaseRequest):
+        if not self.settings.use_rlrq_rlre and type(event) is acse.ReleaseRequest:
             # Client has issued a release request but the connection is not using them
             # Connection states goes to NO_ASSOCIATION directly
 
@@ -288,7 +322,7 @@ class DlmsConnection:
             )
 
         self.state.process_event(event)
-        LOG.debug(f"Preparing to send DLMS Request", request=event)
+        LOG.debug("Preparing to send DLMS Request", request=event)
 
         if self.use_protection:
             event = self.protect(event)
@@ -297,7 +331,7 @@ class DlmsConnection:
         #    blocks = self.make_blocks(event)
         #    # TODO: How to handle the subcase of sending blocks?
 
-        LOG.info(f"Sending DLMS Request", request=event)
+        LOG.info("Sending DLMS Request", request=event)
 
         out = event.to_bytes()
 
@@ -314,7 +348,7 @@ class DlmsConnection:
         After this you could call next_event
         """
         if data:
-            LOG.debug(f"Adding data to buffer", data=data)
+            LOG.debug("Adding data to buffer", data=data)
             self.buffer += data
 
     def next_event(self):
@@ -329,23 +363,24 @@ class DlmsConnection:
         """
 
         apdu = XDlmsApduFactory.apdu_from_bytes(self.buffer)
+        # APDU classes are not subclassed, so the type is checked once per step
+        # instead of doing isinstance checks.
+        apdu_type = type(apdu)
 
         LOG.info("Received DLMS Response", response=apdu)
 
-        if isinstance(apdu, acse.ApplicationAssociationResponse):
+        if apdu_type is acse.ApplicationAssociationResponse:
             # To be able to run the decryption we need to know some things about the
             # meter and that has to be extracted first
             self.update_meter_info(apdu)
 
         if self.use_protection:
             apdu = self.unprotect(apdu)
+            apdu_type = type(apdu)
             LOG.info("Deciphered DLMS Response", response=apdu)
 
         if self.is_pre_established:
-            if isinstance(
-                    apdu,
-                    (acse.ApplicationAssociationResponse, acse.ReleaseResponse),
-            ):
+            if apdu_type in _ACSE_RESPONSES:
                 raise exceptions.PreEstablishedAssociationError(
                     f"Received a {apdu.__class__.__name__}. In a pre-established "
                     f"association it is not possible to handle ACSE services."
@@ -354,7 +389,7 @@ class DlmsConnection:
         self.state.process_event(apdu)
         self.clear_buffer()
 
-        if isinstance(apdu, acse.ApplicationAssociationResponse):
+        if apdu_type is acse.ApplicationAssociationResponse:
             self.update_negotiated_parameters(apdu)
 
             if apdu.result in [
@@ -372,7 +407,7 @@ class DlmsConnection:
 
         # Handle HLS verification
         if self.state.current_state == dlms_state.HLS_DONE:
-            if isinstance(apdu, xdlms.ActionResponseNormalWithData):
+            if apdu_type is xdlms.ActionResponseNormalWithData:
                 if apdu.status != enums.ActionResultStatus.SUCCESS:
                     self.state.process_event(dlms_state.HlsFailed())
                 if self.authentication.hls_meter_data_is_valid(
@@ -381,9 +416,7 @@ class DlmsConnection:
                     self.state.process_event(dlms_state.HlsSuccess())
                 else:
                     self.state.process_event(dlms_state.HlsFailed())
-            elif isinstance(
-                    apdu, (xdlms.ActionResponseNormalWithError, xdlms.ActionResponseNormal)
-            ):
+            elif apdu_type in _FAILED_HLS_ACTION_RESPONSES:
                 self.state.process_event(dlms_state.HlsFailed())
 
             else:
@@ -393,7 +426,7 @@ class DlmsConnection:
         return apdu
 
     def clear_buffer(self):
-        self.buffer = bytearray()
+        self.buffer.clear()
 
     @property
     def use_protection(self) -> bool:
@@ -401,23 +434,21 @@ class DlmsConnection:
         If the Association is such that APDUs should be protected.
         :return:
         """
-        if (
-                self.global_encryption_key is not None
-                or self.global_authentication_key is not None
-        ):
-            return True
-        else:
-            return False
+        return (
+            self.global_encryption_key is not None
+            or self.global_authentication_key is not None
+        )
 
     def protect(self, event) -> Any:
         """
         Will apply the correct protection to apdus depending on the security context
         """
 
-        LOG.info(f"Ciphering DLMS Request", apdu=event)
+        LOG.info("Ciphering DLMS Request", apdu=event)
 
         # ASCE have different rules about protection
-        if isinstance(event, (acse.ApplicationAssociationRequest, acse.ReleaseRequest)):
+        event_type = type(event)
+        if event_type in _ACSE_REQUESTS:
             if event.user_information:
                 ciphered_text, ic = self.encrypt(
                     event.user_information.content.to_bytes()
@@ -432,7 +463,7 @@ class DlmsConnection:
                 )
 
         # XDLMS apdus should be protected with general-glo-ciphering
-        elif isinstance(event, AbstractXDlmsApdu):
+        elif _is_xdlms_apdu(event_type):
             ciphered_text, ic = self.encrypt(event.to_bytes())
 
             if self.settings.empty_system_title_in_general_glo_ciphering:
@@ -476,6 +507,7 @@ class DlmsConnection:
             key=self.global_encryption_key,
             auth_key=self.global_authentication_key,
             plain_text=plain_text,
+            cipher=self.get_global_cipher(),
         )
 
         # updated the client_invocation_counter
@@ -483,6 +515,17 @@ class DlmsConnection:
 
         return ciphered_text, invocation_counter
 
+    def get_global_cipher(self) -> security.AESGCM:
+        """
+        The cipher for the global encryption key is kept between APDUs so the key is
+        only set up once. It is made again if the key is changed.
+        """
+        if self._global_cipher_key != self.global_encryption_key:
+            security.validate_key(self.security_suite, self.global_encryption_key)
+            self._global_cipher = security.AESGCM(self.global_encryption_key)
+            self._global_cipher_key = self.global_encryption_key
+        return self._global_cipher
+
     def decrypt(
             self,
             ciphered_text: bytes,
@@ -522,26 +565,19 @@ class DlmsConnection:
         when trying to decrypt.
         """
 
-        if isinstance(
-                event, (acse.ApplicationAssociationResponse, acse.ReleaseResponse)
-        ):
+        event_type = type(event)
+        if event_type in _ACSE_RESPONSES:
             if event.user_information:
-                if isinstance(
-                        event.user_information.content,
-                        xdlms.GlobalCipherInitiateResponse,
-                ):
-                    self.update_meter_invocation_counter(
-                        event.user_information.content.invocation_counter
-                    )
-                    plain_text = self.decrypt(
-                        event.user_information.content.ciphered_text
-                    )
+                content = event.user_information.content
+                if isinstance(content, xdlms.GlobalCipherInitiateResponse):
+                    self.update_meter_invocation_counter(content.invocation_counter)
+                    plain_text = self.decrypt(content.ciphered_text)
                     # Replace the ciphered InitiateResponse with the decrypted.
                     event.user_information.content = xdlms.InitiateResponse.from_bytes(
                         plain_text
                     )
 
-        elif isinstance(event, xdlms.GeneralGlobalCipher):
+        elif event_type is xdlms.GeneralGlobalCipher:
             self.update_meter_invocation_counter(event.invocation_counter)
             plain_text = self.decrypt(event.ciphered_text)
             return XDlmsApduFactory.apdu_from_bytes(plain_text)
@@ -608,11 +644,10 @@ class DlmsConnection:
         """
 
         if aare.user_information:
-            if isinstance(aare.user_information.content, xdlms.InitiateResponse):
-                self.conformance = aare.user_information.content.negotiated_conformance
-                self.max_pdu_size = (
-                    aare.user_information.content.server_max_receive_pdu_size
-                )
+            content = aare.user_information.content
+            if isinstance(content, xdlms.InitiateResponse):
+                self.conformance = content.negotiated_conformance
+                self.max_pdu_size = content.server_max_receive_pdu_size
 
     def update_meter_invocation_counter(self, received_invocation_counter: int) -> None:
         """
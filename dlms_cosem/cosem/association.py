@@ -17,7 +17,7 @@ class AccessRight(IntEnum):
     DIGITALLY_SIGNED_RESPONSE = 7
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AttributeAccessRights:
     attribute: int
     access_rights: List[AccessRight]
@@ -26,13 +26,13 @@ class AttributeAccessRights:
     )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class MethodAccessRights:
     method: int
     access_rights: List[AccessRight]
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class AssociationObjectListItem:
     interface: enumerations.CosemInterface
     logical_name: cosem.Obis
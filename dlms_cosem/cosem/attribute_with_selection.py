@@ -7,7 +7,7 @@ from dlms_cosem.cosem import selective_access
 from .base import CosemAttribute
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class CosemAttributeWithSelection:
     attribute: CosemAttribute
     access_selection: Optional[
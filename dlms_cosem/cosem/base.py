@@ -1,3 +1,4 @@
+import struct
 from typing import *
 
 import attr
@@ -5,8 +6,11 @@ import attr
 from dlms_cosem import enumerations
 from dlms_cosem.cosem.obis import Obis
 
+# Interface class (2 bytes), instance OBIS (6 bytes) and attribute or method (1 byte)
+COSEM_REFERENCE_FORMAT = struct.Struct(">H6sB")
 
-@attr.s(auto_attribs=True)
+
+@attr.s(auto_attribs=True, slots=True)
 class CosemAttribute:
 
     interface: enumerations.CosemInterface
@@ -22,22 +26,18 @@ class CosemAttribute:
                 f"Data is not of correct lenght. Should be {cls.LENGTH} but is "
                 f"{len(source_bytes)}"
             )
-        interface = enumerations.CosemInterface(int.from_bytes(source_bytes[:2], "big"))
-        instance = Obis.from_bytes(source_bytes[2:8])
-        attribute = source_bytes[-1]
-        return cls(interface, instance, attribute)
+        interface, instance, attribute = COSEM_REFERENCE_FORMAT.unpack(source_bytes)
+        return cls(
+            enumerations.CosemInterface(interface), Obis.from_bytes(instance), attribute
+        )
 
     def to_bytes(self) -> bytes:
-        return b"".join(
-            [
-                self.interface.to_bytes(2, "big"),
-                self.instance.to_bytes(),
-                self.attribute.to_bytes(1, "big"),
-            ]
+        return COSEM_REFERENCE_FORMAT.pack(
+            self.interface, self.instance.to_bytes(), self.attribute
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class CosemMethod:
 
     interface: enumerations.CosemInterface
@@ -53,16 +53,12 @@ class CosemMethod:
                 f"Data is not of correct length. Should be {cls.LENGTH} but is "
                 f"{len(source_bytes)}"
             )
-        interface = enumerations.CosemInterface(int.from_bytes(source_bytes[:2], "big"))
-        instance = Obis.from_bytes(source_bytes[2:8])
-        method = source_bytes[-1]
-        return cls(interface, instance, method)
+        interface, instance, method = COSEM_REFERENCE_FORMAT.unpack(source_bytes)
+        return cls(
+            enumerations.CosemInterface(interface), Obis.from_bytes(instance), method
+        )
 
     def to_bytes(self) -> bytes:
-        return b"".join(
-            [
-                self.interface.to_bytes(2, "big"),
-                self.instance.to_bytes(),
-                self.method.to_bytes(1, "big"),
-            ]
+        return COSEM_REFERENCE_FORMAT.pack(
+            self.interface, self.instance.to_bytes(), self.method
         )
@@ -5,7 +5,7 @@ from dlms_cosem import dlms_data, utils
 from .base import CosemAttribute
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class CaptureObject:
     """
     Definition of a value that is supposed to be saved in a Profile Generic.
@@ -1,21 +1,20 @@
+import functools
 import re
+import struct
 from typing import *
 
 import attr
 
-six_part = re.compile(
-    "^(\\d{1,3}).(\\d{1,3}).(\\d{1,3}).(\\d{1,3}).(\\d{1,3}).(\\d{1,3})$"
+# Five or six groups of digits with any single non digit separator. The last group
+# (F) is optional.
+obis_string_pattern = re.compile(
+    r"^(\d{1,3})\D(\d{1,3})\D(\d{1,3})\D(\d{1,3})\D(\d{1,3})(?:\D(\d{1,3}))?$"
 )
-five_part = re.compile("^(\\d{1,3}).(\\d{1,3}).(\\d{1,3}).(\\d{1,3}).(\\d{1,3})$")
+# A, B, C, D, E and F are one byte each.
+OBIS_FORMAT = struct.Struct("6B")
 
 
-def allowed_range_for_obis_code(instance, attribute, value: int):
-
-    if 0 > value > 255:
-        raise ValueError("An obis can only be between 0 - 255")
-
-
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class Obis:
 
     """
@@ -23,34 +22,27 @@ class Obis:
     data items in metering equipment.
     """
 
-    a: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code]
-    )
-    b: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code]
-    )
-    c: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code]
-    )
-    d: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code]
-    )
-    e: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code]
-    )
-    f: int = attr.ib(
-        validator=[attr.validators.instance_of(int), allowed_range_for_obis_code],
-        default=255,
-    )
+    a: int
+    b: int
+    c: int
+    d: int
+    e: int
+    f: int = attr.ib(default=255)
+
+    def __attrs_post_init__(self):
+        # One check for all six values. Any bit above the lowest byte, or a negative
+        # value, means a value is outside 0 - 255.
+        if (self.a | self.b | self.c | self.d | self.e | self.f) & ~0xFF:
+            raise ValueError("An obis can only be between 0 - 255")
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        data = bytearray(source_bytes)
-        if len(data) != 6:
+        if len(source_bytes) != OBIS_FORMAT.size:
             raise ValueError(
-                f"Not enough data to parse OBIS. Need 6 bytes but got {len(data)}"
+                f"Not enough data to parse OBIS. Need 6 bytes but got "
+                f"{len(source_bytes)}"
             )
-        return cls(data[0], data[1], data[2], data[3], data[4], data[5])
+        return _obis_from_values(cls, *OBIS_FORMAT.unpack(source_bytes))
 
     @classmethod
     def from_string(cls, obis_string: str) -> "Obis":
@@ -58,28 +50,19 @@ class Obis:
         Parses a string as an OBIS code. Will accept with both the optinal 255 at the
         and and not. Any separator is allowed.
         """
-        six_match = re.match(six_part, obis_string)
-        if six_match:
-            parts = six_match.groups()
-            return cls(
-                a=int(parts[0]),
-                b=int(parts[1]),
-                c=int(parts[2]),
-                d=int(parts[3]),
-                e=int(parts[4]),
-            )
-        five_match = re.match(five_part, obis_string)
-        if five_match:
-            parts = five_match.groups()
-            return cls(
-                a=int(parts[0]),
-                b=int(parts[1]),
-                c=int(parts[2]),
-                d=int(parts[3]),
-                e=int(parts[4]),
-            )
+        match = obis_string_pattern.match(obis_string)
+        if not match:
+            raise ValueError(f"{obis_string} is not a parsable OBIS string")
 
-        raise ValueError(f"{obis_string} is not a parsable OBIS string")
+        a, b, c, d, e, f = match.groups()
+        return cls(
+            a=int(a),
+            b=int(b),
+            c=int(c),
+            d=int(d),
+            e=int(e),
+            f=int(f) if f is not None else 255,
+        )
 
     def to_string(self, separator: Optional[str] = None) -> str:
         if separator:
@@ -91,4 +74,15 @@ class Obis:
             return f"{self.a}-{self.b}:{self.c}.{self.d}.{self.e}.{self.f}"
 
     def to_bytes(self) -> bytes:
-        return bytes(bytearray([self.a, self.b, self.c, self.d, self.e, self.f]))
+        return OBIS_FORMAT.pack(self.a, self.b, self.c, self.d, self.e, self.f)
+
+
+@functools.lru_cache(maxsize=1024)
+def _obis_from_values(
+    cls: Type[Obis], a: int, b: int, c: int, d: int, e: int, f: int
+) -> Obis:
+    """
+    A meter keeps referring to the same OBIS codes. Obis is immutable so parsed codes
+    can share one instance per code.
+    """
+    return cls(a, b, c, d, e, f)
@@ -7,7 +7,7 @@ from dlms_cosem import cosem, dlms_data, enumerations, time, utils
 from dlms_cosem.cosem.capture_object import CaptureObject
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class RangeDescriptor:
     """
     The range descriptor can be used to read buffers of Profile Generic.
@@ -101,7 +101,7 @@ def validate_unsigned_long_int(instance, attribute, value):
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class EntryDescriptor:
     """
     The entry descriptor limits response data by entries.
@@ -1,6 +1,28 @@
-from ctypes import c_ushort
+import binascii
 from typing import *
 
+# The CRC's are computed using polynomials.
+CRC_CCITT_POLYNOMIAL = 0x1021
+
+
+def make_crc_ccitt_table() -> Tuple[int, ...]:
+    """The algorithm uses tables with pre-calculated values"""
+    table = []
+    for i in range(0, 256):
+        crc = 0
+        c = i << 8
+
+        for j in range(0, 8):
+            if (crc ^ c) & 0x8000:
+                crc = ((crc << 1) & 0xFFFF) ^ CRC_CCITT_POLYNOMIAL
+            else:
+                crc = (crc << 1) & 0xFFFF
+
+            c = (c << 1) & 0xFFFF
+
+        table.append(crc)
+    return tuple(table)
+
 
 class CRCCCITT:
     """
@@ -14,18 +36,19 @@ class CRCCCITT:
 
     """
 
-    crc_ccitt_table: List[int] = list()
-
-    # The CRC's are computed using polynomials.
+    # Built once at import.
+    crc_ccitt_table: ClassVar[Tuple[int, ...]] = make_crc_ccitt_table()
 
-    crc_ccitt_constant = 0x1021
+    crc_ccitt_constant = CRC_CCITT_POLYNOMIAL
 
     def __init__(self):
         self.starting_value = 0xFFFF
 
-        # initialize the pre-calculated tables
-        if not len(self.crc_ccitt_table):
-            self.init_crc_table()
+    def init_crc_table(self):
+        """
+        Kept for compatibility. The table is built once at import so there is nothing
+        left to initialize.
+        """
 
     def calculate_for(self, input_data, lsb_first=False) -> bytes:
         """
@@ -40,60 +63,27 @@ class CRCCCITT:
         reversed_data = reverse_byte_message(input_data)
 
         reversed_crc = self._calculate(reversed_data)
-        lsb_rev = reversed_crc & 0x00FF
-        lsb: int = ord(reverse_byte(lsb_rev))
-        lsb ^= 0xFF
-        lsb_byte = lsb.to_bytes(1, "big")
-        msb_rev = (reversed_crc & 0xFF00) >> 8
-        msb = ord(reverse_byte(msb_rev))
-        msb ^= 0xFF
-        msb_byte = msb.to_bytes(1, "big")
+        lsb = REVERSED_BYTES[reversed_crc & 0x00FF] ^ 0xFF
+        msb = REVERSED_BYTES[reversed_crc >> 8] ^ 0xFF
 
         if lsb_first:
-            return b"".join([lsb_byte, msb_byte])
+            return bytes((lsb, msb))
         else:
-            return b"".join([msb_byte, lsb_byte])
+            return bytes((msb, lsb))
 
     def _calculate(self, input_data: bytes):
+        # binascii.crc_hqx is the same table driven CRC-CCITT (0x1021) as
+        # crc_ccitt_table describes, implemented in C.
+        return binascii.crc_hqx(input_data, self.starting_value)
 
-        crc_value = self.starting_value
-
-        for c in input_data:
-            tmp = ((crc_value >> 8) & 0xFF) ^ c
-            crc_shifted = (crc_value << 8) & 0xFF00
-            crc_value = crc_shifted ^ self.crc_ccitt_table[tmp]
-
-        return crc_value
-
-    def init_crc_table(self):
-        """The algorithm uses tables with pre-calculated values"""
-        for i in range(0, 256):
-            crc = 0
-            c = i << 8
-
-            for j in range(0, 8):
-                if (crc ^ c) & 0x8000:
-                    crc = c_ushort(crc << 1).value ^ self.crc_ccitt_constant
-                else:
-                    crc = c_ushort(crc << 1).value
 
-                c = c_ushort(c << 1).value  # equivalent of c = c << 1
-
-            self.crc_ccitt_table.append(crc)
+# Every byte value with its bits in reversed order. Index with the byte to reverse.
+REVERSED_BYTES = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
 
 
 def reverse_byte(byte_to_reverse):
-    and_value = 1
-    reversed_byte = 0
-    for i in range(0, 8):
-        reversed_byte += ((byte_to_reverse & and_value) >> i) * (2 ** (7 - i))
-        and_value += and_value
-
-    return (chr(reversed_byte)).encode("latin-1")
+    return REVERSED_BYTES[byte_to_reverse : byte_to_reverse + 1]
 
 
 def reverse_byte_message(msg):
-    reversed_mgs = b""
-    for char in msg:
-        reversed_mgs += reverse_byte(char)
-    return reversed_mgs
+    return bytes(msg).translate(REVERSED_BYTES)
@@ -49,7 +49,7 @@ class BaseDlmsData(AbstractDlmsData):
         out.append(self.TAG)
         value_bytes = self.value_to_bytes()
         if self.LENGTH == VARIABLE_LENGTH:
-            out.append(len(value_bytes))
+            out.extend(encode_variable_integer(len(value_bytes)))
         out.extend(value_bytes)
         return bytes(out)
 
@@ -557,17 +557,10 @@ def decode_variable_integer(bytes_input: bytes):
 
 def encode_variable_integer(length: int):
     if length > 0b01111111:
-        encoded_length = 1
-        while True:
-            try:
-                length.to_bytes(encoded_length, "big")
-            except OverflowError:
-                encoded_length += 1
-                continue
-            break
-
-        length_byte = (0b10000000 + encoded_length).to_bytes(1, "big")
-        return length_byte + length.to_bytes(encoded_length, "big")
+        encoded_length = (length.bit_length() + 7) // 8
+        return bytes([0b10000000 + encoded_length]) + length.to_bytes(
+            encoded_length, "big"
+        )
 
     else:
-        return length.to_bytes(1, "big")
+        return bytes([length])
@@ -5,7 +5,7 @@ import attr
 from dlms_cosem.hdlc import validators
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, frozen=True, cache_hash=True)
 class HdlcAddress:
     """
     A client address shall always be expressed on one byte.
@@ -28,6 +28,11 @@ class HdlcAddress:
         default="client", validator=[validators.validate_hdlc_address_type]
     )
     extended_addressing: bool = attr.ib(default=False)
+    # The address is immutable so it is encoded once and reused in every frame.
+    _encoded: bytes = attr.ib(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        object.__setattr__(self, "_encoded", self._encode())
 
     @property
     def length(self):
@@ -35,11 +40,19 @@ class HdlcAddress:
         The number of bytes the address makes up.
         :return:
         """
-        return len(self.to_bytes())
+        return len(self._encoded)
 
     def to_bytes(self):
+        return self._encoded
+
+    def _encode(self) -> bytes:
         out: List[Optional[int]] = list()
         if self.address_type == "client":
+            if not 0 <= self.logical_address <= 0b01111111:
+                raise ValueError(
+                    f"Hdlc client address must be between 0 and 127, but is "
+                    f"{self.logical_address}"
+                )
             # shift left 1 bit and set the lsb to mark end of address.
             out.append(((self.logical_address << 1) | 0b00000001))
         else:
@@ -78,6 +91,11 @@ class HdlcAddress:
         higher: Optional[int]
         lower: int
 
+        if not 0 <= address <= 0b0011111111111111:
+            raise ValueError(
+                f"Hdlc server address must be between 0 and 16383, but is {address}"
+            )
+
         if address > 0b01111111:
             lower = (address & 0b0000000001111111) << 1
             higher = (address & 0b0011111110000000) >> 6
@@ -115,23 +133,15 @@ class HdlcAddress:
 
     @staticmethod
     def extract_address_bytes(in_data: bytes) -> Tuple[bytes, bytes]:
-
-        address = bytearray()
-        data = bytearray(in_data)
-        found_whole_address = False
-        while not found_whole_address:
-            _byte = data.pop(0)
+        # The last byte of the address has the LSB set. Find it by index instead of
+        # popping bytes from the front of the data.
+        for length, _byte in enumerate(in_data, start=1):
+            if length > 4:
+                break
             if bool(_byte & 0b00000001):
-                address.append(_byte)
-                found_whole_address = True
-            else:
-                address.append(_byte)
-            if len(address) > 4:
-                raise ValueError(
-                    "Recovered and HDLC address of length longer than 4 bytes"
-                )
+                return bytes(in_data[:length]), bytes(in_data[length:])
 
-        return bytes(address), bytes(data)
+        raise ValueError("Could not recover an HDLC address of 1-4 bytes")
 
     @staticmethod
     def find_address_in_frame_bytes(
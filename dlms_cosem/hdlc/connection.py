@@ -56,6 +56,23 @@ class HdlcConnection:
 
         return frame.to_bytes()
 
+    def send_encoded(self, frame_type, frame_bytes: bytes) -> bytes:
+        """
+        Changes the connection state as if a frame of frame_type was sent and returns
+        the already encoded frame bytes. Information frames can't be sent like this
+        since sending them updates the sequence numbers.
+        :param frame_type: HDLC frame class
+        :param frame_bytes: encoded HDLC frame
+        :return: bytes
+        """
+        if frame_type is frames.InformationFrame:
+            raise LocalProtocolError(
+                "An InformationFrame must be sent via send() to keep track of the "
+                "sequence numbers"
+            )
+        self.state.process_frame_type(frame_type)
+        return frame_bytes
+
     def handle_sequence_numbers(self, frame_ssn: int, frame_rsn: int, response: bool):
         if not response:
             if frame_ssn != self.server_ssn or frame_rsn != self.server_rsn:
@@ -91,7 +108,7 @@ class HdlcConnection:
         After this you could call next_event
         """
         if data:
-            LOG.debug(f"Added data to buffer", data=data)
+            LOG.debug("Added data to buffer", data=data)
             self.buffer += data
 
     def next_event(self):
@@ -137,7 +154,7 @@ class HdlcConnection:
             LOG.debug("HDLC frame could not be parsed. Need more data")
             return NEED_DATA
 
-        LOG.debug(f"Received HDLC frame", frame=frame)
+        LOG.debug("Received HDLC frame", frame=frame)
         self.state.process_frame(frame)
         self._tidy_buffer()
 
@@ -134,7 +134,11 @@ class BaseHdlcFrame(_AbstractHdlcFrame):
         return b"".join([self.header_content, self.hcs, self.information])
 
     def to_bytes(self):
-        return b"".join([HDLC_FLAG, self.frame_content, self.fcs, HDLC_FLAG])
+        # The FCS is calculated over the frame content so only build it once.
+        frame_content = self.frame_content
+        return b"".join(
+            [HDLC_FLAG, frame_content, FCS.calculate_for(frame_content), HDLC_FLAG]
+        )
 
     def get_control_field(self):
         """
@@ -89,6 +89,10 @@ class HdlcConnectionState:
 
         self._transition_state(type(frame))
 
+    def process_frame_type(self, frame_type):
+
+        self._transition_state(frame_type)
+
     def _transition_state(self, frame_type):
         try:
             new_state = HDLC_STATE_TRANSITIONS[self.current_state][frame_type]
@@ -98,4 +102,4 @@ class HdlcConnectionState:
             )
         old_state = self.current_state
         self.current_state = new_state
-        LOG.debug(f"HDLC state transitioned", old_state=old_state, new_state=new_state)
+        LOG.debug("HDLC state transitioned", old_state=old_state, new_state=new_state)
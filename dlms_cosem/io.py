@@ -1,7 +1,9 @@
 from __future__ import annotations  # noqa
 
+import functools
 import socket
 import sys
+import time
 from typing import Optional, Tuple
 
 from dlms_cosem.hdlc import connection, address, state, frames
@@ -15,6 +17,7 @@ import attr
 import serial
 
 from dlms_cosem import exceptions
+from dlms_cosem.protocol.wrappers import WrapperHeader, WrapperProtocolDataUnit
 
 from typing import *
 
@@ -29,10 +32,62 @@ LLC_COMMAND_HEADER = b"\xe6\xe6\x00"
 LLC_RESPONSE_HEADER = b"\xe6\xe7\x00"
 
 
+# Max amount of bytes to read from a socket in one call.
+TCP_RECV_SIZE = 4096
+# Size of the serial driver receive buffer, where it can be set.
+SERIAL_RX_BUFFER_SIZE = 65536
+
+
 class ClientError(Exception):
     """General error in client"""
 
 
+def _take_from_buffer(buffer: bytearray, amount: int) -> bytes:
+    """
+    Removes and returns the first `amount` bytes of the buffer.
+    """
+    # Copy out via a memoryview so the data is only copied once. The view must
+    # be released before the buffer can be resized.
+    with memoryview(buffer) as view:
+        data = bytes(view[:amount])
+    del buffer[:amount]
+    return data
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_control_frame(
+    frame_type: Type[frames.BaseHdlcFrame],
+    destination_address: address.HdlcAddress,
+    source_address: address.HdlcAddress,
+) -> bytes:
+    """
+    Control frames like SNRM and DISC only depend on the addresses used. So the
+    encoded frame can be reused for every connection using the same addresses.
+    """
+    frame = frame_type(
+        destination_address=destination_address, source_address=source_address
+    )
+    return frame.to_bytes()
+
+
+@functools.lru_cache(maxsize=256)
+def _encoded_receive_ready_frame(
+    destination_address: address.HdlcAddress,
+    source_address: address.HdlcAddress,
+    receive_sequence_number: int,
+) -> bytes:
+    """
+    A RR frame only depends on the addresses and the receive sequence number, which
+    can only be 0-7. So the few possible frames are encoded once.
+    """
+    frame = frames.ReceiveReadyFrame(
+        destination_address=destination_address,
+        source_address=source_address,
+        receive_sequence_number=receive_sequence_number,
+    )
+    return frame.to_bytes()
+
+
 class IoImplementation(Protocol):
     def connect(self) -> None:
         ...
@@ -77,6 +132,8 @@ class SerialIO:
     timeout: int = attr.ib(default=10)
 
     serial_port: Optional[serial.Serial] = attr.ib(init=False, default=None)
+    # Data read from the port but not yet returned to the caller.
+    read_buffer: bytearray = attr.ib(init=False, factory=bytearray)
 
     def connect(self):
         if self.serial_port:
@@ -87,11 +144,17 @@ class SerialIO:
         self.serial_port = serial.Serial(
             port=self.port_name, baudrate=self.baud_rate, timeout=self.timeout
         )
+        # Only the Windows implementation can set the size of the driver buffer. Its
+        # default of 4096 bytes can overflow on large block transfers at high baud
+        # rates.
+        if hasattr(self.serial_port, "set_buffer_size"):
+            self.serial_port.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
 
     def disconnect(self):
         if self.serial_port:
             self.serial_port.close()
         self.serial_port = None
+        self.read_buffer.clear()
 
     def send(self, data: bytes) -> None:
         if self.serial_port:
@@ -100,18 +163,41 @@ class SerialIO:
             raise RuntimeError("Trying to send data on closed serial port")
 
     def recv(self, amount: int = 1) -> bytes:
-        if self.serial_port:
-            data = self.serial_port.read(amount)
-        else:
+        if not self.serial_port:
             raise RuntimeError("Trying to read data from closed serial port")
-        return data
+        missing = amount - len(self.read_buffer)
+        if missing > 0:
+            self.read_buffer += self.serial_port.read(missing)
+        return _take_from_buffer(self.read_buffer, amount)
 
     def recv_until(self, end: bytes) -> bytes:
-        if self.serial_port:
-            data = self.serial_port.read_until(end)
-        else:
+        """
+        Reads until `end` is found. Instead of reading one byte at a time, as
+        `serial.Serial.read_until` does, all bytes waiting on the port are read at
+        once. Bytes received after `end` are kept for the next read.
+        On timeout the data received so far is returned. The timeout covers the whole
+        call, not each read, so a port that keeps sending data without `end` can't
+        block forever.
+        """
+        if not self.serial_port:
             raise RuntimeError("Trying to read data from closed serial port")
-        return data
+
+        timeout = serial.serialutil.Timeout(self.timeout)
+        end_index = self.read_buffer.find(end)
+        while end_index == -1:
+            chunk = self.serial_port.read(self.serial_port.in_waiting or 1)
+            if not chunk:
+                # timeout
+                return _take_from_buffer(self.read_buffer, len(self.read_buffer))
+            # Only search the new data, and the bytes before it that could be the
+            # start of `end`.
+            scan_from = max(len(self.read_buffer) - len(end) + 1, 0)
+            self.read_buffer += chunk
+            end_index = self.read_buffer.find(end, scan_from)
+            if end_index == -1 and timeout.expired():
+                return _take_from_buffer(self.read_buffer, len(self.read_buffer))
+
+        return _take_from_buffer(self.read_buffer, end_index + len(end))
 
 
 @attr.s(auto_attribs=True)
@@ -122,8 +208,23 @@ class BlockingTcpIO:
 
     host: str
     port: int
-    timeout: int = attr.ib(default=10)
+    # None blocks until data arrives, like a socket without a timeout.
+    timeout: Optional[int] = attr.ib(default=10)
+    # Extra (level, option, value) arguments for socket.setsockopt applied after
+    # connecting. The socket buffer sizes are left to the OS by default. Setting
+    # SO_RCVBUF or SO_SNDBUF turns off the kernels automatic tuning of them.
+    socket_options: Sequence[Tuple[int, int, int]] = attr.ib(default=())
     tcp_socket: Optional[socket.socket] = attr.ib(init=False, default=None)
+    # Data read from the socket but not yet returned to the caller.
+    read_buffer: bytearray = attr.ib(init=False, factory=bytearray)
+    # The socket is read into this buffer and the received bytes are copied over to
+    # read_buffer. Avoids allocating a new bytes object for every read.
+    _recv_view: memoryview = attr.ib(
+        init=False,
+        factory=lambda: memoryview(bytearray(TCP_RECV_SIZE)),
+        repr=False,
+        eq=False,
+    )
 
     @property
     def address(self) -> Tuple[str, int]:
@@ -148,7 +249,12 @@ class BlockingTcpIO:
             ConnectionRefusedError,
         ) as e:
             raise exceptions.CommunicationError("Unable to connect socket") from e
-        LOG.info(f"Connected to {self.address}")
+        # Every request is written whole and then waits for the response, so there
+        # is nothing for Nagle's algorithm to coalesce. Only the delay.
+        self.tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for level, option, value in self.socket_options:
+            self.tcp_socket.setsockopt(level, option, value)
+        LOG.info("Connected", address=self.address)
 
     def disconnect(self):
         """
@@ -164,7 +270,8 @@ class BlockingTcpIO:
                 self.tcp_socket = None
                 raise exceptions.CommunicationError from e
             self.tcp_socket = None
-            LOG.info(f"Connection to {self.address} is closed")
+            self.read_buffer.clear()
+            LOG.info("Connection closed", address=self.address)
 
     def send(self, data: bytes):
         """
@@ -183,19 +290,61 @@ class BlockingTcpIO:
         """
         if not self.tcp_socket:
             raise RuntimeError("TCP transport not connected.")
-        data = b""
-        while len(data) < amount:
-            try:
-                data += self.tcp_socket.recv(amount - len(data))
-            except (OSError, IOError, socket.timeout, socket.error) as e:
-                raise exceptions.CommunicationError("Could not receive data") from e
-        return data
+        deadline = self._deadline()
+        while len(self.read_buffer) < amount:
+            self._fill_read_buffer(deadline)
+        return _take_from_buffer(self.read_buffer, amount)
 
     def recv_until(self, end: bytes) -> bytes:
-        data = b""
-        while not data.endswith(end):
-            data += self.recv()
-        return data
+        """
+        Reads until `end` is found. Bytes received after `end` are kept for the next
+        read.
+        """
+        if not self.tcp_socket:
+            raise RuntimeError("TCP transport not connected.")
+        deadline = self._deadline()
+        end_index = self.read_buffer.find(end)
+        while end_index == -1:
+            # Only search the new data, and the bytes before it that could be the
+            # start of `end`.
+            scan_from = max(len(self.read_buffer) - len(end) + 1, 0)
+            self._fill_read_buffer(deadline)
+            end_index = self.read_buffer.find(end, scan_from)
+        return _take_from_buffer(self.read_buffer, end_index + len(end))
+
+    def _deadline(self) -> Optional[float]:
+        if self.timeout is None:
+            return None
+        return time.monotonic() + self.timeout
+
+    def _fill_read_buffer(self, deadline: Optional[float]) -> None:
+        """
+        Reads what is available on the socket, up to TCP_RECV_SIZE bytes, into the
+        read buffer.
+        The socket timeout only applies to each read. Setting it to the time left
+        until `deadline` before every read makes the timeout apply to the whole
+        response, even if the remote keeps sending a byte at a time. Without a
+        deadline the read blocks until data arrives.
+        """
+        try:
+            if deadline is None:
+                received = self.tcp_socket.recv_into(self._recv_view)
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise exceptions.CommunicationError("Timed out waiting for data")
+                self.tcp_socket.settimeout(remaining)
+                try:
+                    received = self.tcp_socket.recv_into(self._recv_view)
+                finally:
+                    self.tcp_socket.settimeout(self.timeout)
+        except socket.timeout as e:
+            raise exceptions.CommunicationError("Timed out waiting for data") from e
+        except (OSError, IOError, socket.error) as e:
+            raise exceptions.CommunicationError("Could not receive data") from e
+        if not received:
+            raise exceptions.CommunicationError("Connection closed by remote")
+        self.read_buffer += self._recv_view[:received]
 
 
 @attr.s(auto_attribs=True)
@@ -235,7 +384,7 @@ class TcpTransport:
         """
         wrapped = self.wrap(bytes_to_send)
         LOG.debug("Sending data", data=wrapped, transport=self)
-        self.io.send(self.wrap(bytes_to_send))
+        self.io.send(wrapped)
 
         return self.recv_response()
 
@@ -247,7 +396,7 @@ class TcpTransport:
         header = WrapperHeader.from_bytes(header_data)
         data = self.io.recv(header.length)
 
-        LOG.debug("Received data", data=header_data + data, transport=self)
+        LOG.debug("Received data", header=header_data, data=data, transport=self)
 
         return data
 
@@ -258,13 +407,45 @@ class HdlcTransport:
     HDLC transport to send data over serial.
     """
 
-    client_logical_address: int
-    server_logical_address: int
+    client_logical_address: int = attr.ib(on_setattr=attr.setters.frozen)
+    server_logical_address: int = attr.ib(on_setattr=attr.setters.frozen)
     io: IoImplementation
-    server_physical_address: Optional[int] = attr.ib(default=None)
-    client_physical_address: Optional[int] = attr.ib(default=None)
-    extended_addressing: bool = attr.ib(default=False)
+    server_physical_address: Optional[int] = attr.ib(
+        default=None, on_setattr=attr.setters.frozen
+    )
+    client_physical_address: Optional[int] = attr.ib(
+        default=None, on_setattr=attr.setters.frozen
+    )
+    extended_addressing: bool = attr.ib(
+        default=False, on_setattr=attr.setters.frozen
+    )
     timeout: int = attr.ib(default=10)
+    # The addresses are used in every frame so they are only created once. The
+    # fields they are built from are frozen so they can't go stale.
+    server_hdlc_address: address.HdlcAddress = attr.ib(
+        init=False,
+        default=attr.Factory(
+            lambda self: address.HdlcAddress(
+                logical_address=self.server_logical_address,
+                physical_address=self.server_physical_address,
+                address_type="server",
+                extended_addressing=self.extended_addressing,
+            ),
+            takes_self=True,
+        ),
+    )
+    client_hdlc_address: address.HdlcAddress = attr.ib(
+        init=False,
+        default=attr.Factory(
+            lambda self: address.HdlcAddress(
+                logical_address=self.client_logical_address,
+                physical_address=self.client_physical_address,
+                address_type="client",
+                extended_addressing=self.extended_addressing,
+            ),
+            takes_self=True,
+        ),
+    )
     hdlc_connection: connection.HdlcConnection = attr.ib(
         default=attr.Factory(
             lambda self: connection.HdlcConnection(
@@ -274,26 +455,12 @@ class HdlcTransport:
         )
     )
 
-    _send_buffer: list = attr.ib(factory=list)
     out_buffer: bytearray = attr.ib(init=False, factory=bytearray)
     in_buffer: bytearray = attr.ib(init=False, factory=bytearray)
 
-    @property
-    def server_hdlc_address(self):
-        return address.HdlcAddress(
-            logical_address=self.server_logical_address,
-            physical_address=self.server_physical_address,
-            address_type="server",
-            extended_addressing=self.extended_addressing,
-        )
-
-    @property
-    def client_hdlc_address(self):
-        return address.HdlcAddress(
-            logical_address=self.client_logical_address,
-            physical_address=self.client_physical_address,
-            address_type="client",
-            extended_addressing=self.extended_addressing,
+    def encoded_control_frame(self, frame_type: Type[frames.BaseHdlcFrame]) -> bytes:
+        return _encoded_control_frame(
+            frame_type, self.server_hdlc_address, self.client_hdlc_address
         )
 
     def connect(self):
@@ -310,11 +477,10 @@ class HdlcTransport:
                 f"not in NOT_CONNECTED but in "
                 f"state={self.hdlc_connection.state.current_state}"
             )
-        snrm = frames.SetNormalResponseModeFrame(
-            destination_address=self.server_hdlc_address,
-            source_address=self.client_hdlc_address,
+        self.out_buffer += self.hdlc_connection.send_encoded(
+            frames.SetNormalResponseModeFrame,
+            self.encoded_control_frame(frames.SetNormalResponseModeFrame),
         )
-        self.out_buffer += self.hdlc_connection.send(snrm)
         self.drain_out_buffer()
         ua_response = self.next_event()
         return ua_response
@@ -324,12 +490,9 @@ class HdlcTransport:
         Sends a DisconnectFrame
         :return:
         """
-        disc = frames.DisconnectFrame(
-            destination_address=self.server_hdlc_address,
-            source_address=self.client_hdlc_address,
+        self.out_buffer += self.hdlc_connection.send_encoded(
+            frames.DisconnectFrame, self.encoded_control_frame(frames.DisconnectFrame)
         )
-
-        self.out_buffer += self.hdlc_connection.send(disc)
         self.drain_out_buffer()
         response = self.next_event()
         self.io.disconnect()
@@ -376,12 +539,14 @@ class HdlcTransport:
             if response.segmented and response.final:
                 # there is still data but server has send its max window size
                 # tell the server to send more.
-                rr = frames.ReceiveReadyFrame(
-                    destination_address=self.server_hdlc_address,
-                    source_address=self.client_hdlc_address,
-                    receive_sequence_number=self.hdlc_connection.server_rsn,
+                self.out_buffer += self.hdlc_connection.send_encoded(
+                    frames.ReceiveReadyFrame,
+                    _encoded_receive_ready_frame(
+                        self.server_hdlc_address,
+                        self.client_hdlc_address,
+                        self.hdlc_connection.server_rsn,
+                    ),
                 )
-                self.out_buffer += self.hdlc_connection.send(rr)
                 self.drain_out_buffer()
 
             if response.segmented and not response.final:
@@ -393,8 +558,10 @@ class HdlcTransport:
 
         if not in_buffer.startswith(LLC_RESPONSE_HEADER):
             raise ValueError("The data is not prepended by the LLC response header")
-        # don't return the LLC
-        return in_buffer[3:]
+        # don't return the LLC. Deleting from the front of a bytearray doesn't copy the
+        # rest of the data, unlike slicing.
+        del in_buffer[: len(LLC_RESPONSE_HEADER)]
+        return in_buffer
 
     def drain_out_buffer(self):
         """
@@ -406,15 +573,24 @@ class HdlcTransport:
         False
         :return:
         """
+        if self.hdlc_connection.state.current_state != state.IDLE:
+            # The buffer holds already encoded frames, (SNRM, DISC, RR), and they
+            # are not limited by the information field size. Send them in one write.
+            data = bytes(self.out_buffer)
+            self.out_buffer.clear()
+            LOG.debug("Sending data", data=data, transport=self)
+            self.io.send(data)
+            return
+
         data_size = self.hdlc_connection.max_data_size
         while len(self.out_buffer) > 0:
-            data = self.out_buffer[:data_size]
-            self.out_buffer = self.out_buffer[data_size:]
-            segmented = bool(self.out_buffer)
-            if self.hdlc_connection.state.current_state != state.IDLE:
-                LOG.debug("Sending data", data=data, transport=self)
-                self.io.send(data)
-                return
+            segmented = len(self.out_buffer) > data_size
+            if segmented:
+                data = _take_from_buffer(self.out_buffer, data_size)
+            else:
+                # The last, and usually the only, frame takes the rest of the buffer.
+                data = bytes(self.out_buffer)
+                self.out_buffer.clear()
             # We don't handle window sizes so final is always true
             out_frame = self.generate_information_frame(
                 data, segmented=segmented, final=True
@@ -442,8 +618,8 @@ class HdlcTransport:
         )
 
     def send_frame(self, frame):
-        LOG.info(f"Sending HDLC frame", frame=frame)
         frame_bytes = self.hdlc_connection.send(frame)
+        LOG.info("Sending HDLC frame", frame=frame)
         LOG.debug("Sending data", data=frame_bytes, transport=self)
         self.io.send(frame_bytes)
 
@@ -3,7 +3,7 @@ from typing import *
 
 import attr
 
-from dlms_cosem import a_xdr, cosem, enumerations
+from dlms_cosem import cosem, enumerations, utils
 from dlms_cosem.cosem import CosemAttribute
 from dlms_cosem.cosem.association import (
     AccessRight,
@@ -31,12 +31,7 @@ class ProfileGenericBufferParser:
         """
         Profile generic are sent as a sequence of A-XDR encoded DlmsData.
         """
-        data_decoder = a_xdr.AXdrDecoder(
-            encoding_conf=a_xdr.EncodingConf(
-                attributes=[a_xdr.Sequence(attribute_name="data")]
-            )
-        )
-        entries: List[List[Any]] = data_decoder.decode(profile_bytes)["data"]
+        entries: List[List[Any]] = utils.parse_as_dlms_data(profile_bytes)
 
         return self.parse_entries(entries)
 
@@ -100,12 +95,7 @@ class AssociationObjectListParser:
         """
         Profile generic are sent as a sequence of A-XDR encoded DlmsData.
         """
-        data_decoder = a_xdr.AXdrDecoder(
-            encoding_conf=a_xdr.EncodingConf(
-                attributes=[a_xdr.Sequence(attribute_name="data")]
-            )
-        )
-        entries: List[List[Any]] = data_decoder.decode(profile_bytes)["data"]
+        entries: List[List[Any]] = utils.parse_as_dlms_data(profile_bytes)
 
         return AssociationObjectListParser.parse_entries(entries)
 
@@ -1,5 +1,10 @@
+import struct
+
 import attr
 
+# version, source wPort, destination wPort and length as unsigned 16 bit integers.
+WRAPPER_HEADER_FORMAT = struct.Struct(">HHHH")
+
 
 @attr.s(auto_attribs=True)
 class WrapperHeader:
@@ -49,12 +54,9 @@ class WrapperHeader:
     version: int = attr.ib(default=1)
 
     def to_bytes(self):
-        _version = self.version.to_bytes(2, "big")
-        _source_wport = self.source_wport.to_bytes(2, "big")
-        _destination_wport = self.destination_wport.to_bytes(2, "big")
-        _length = self.length.to_bytes(2, "big")
-
-        return _version + _source_wport + _destination_wport + _length
+        return WRAPPER_HEADER_FORMAT.pack(
+            self.version, self.source_wport, self.destination_wport, self.length
+        )
 
     @classmethod
     def from_bytes(cls, in_data):
@@ -63,10 +65,9 @@ class WrapperHeader:
                 f"Wrapper Header can only consists of 8 bytes and "
                 f"got {len(in_data)}"
             )
-        version = int.from_bytes(in_data[0:2], "big")
-        source_wport = int.from_bytes(in_data[2:4], "big")
-        destination_wport = int.from_bytes(in_data[4:6], "big")
-        length = int.from_bytes(in_data[6:8], "big")
+        version, source_wport, destination_wport, length = (
+            WRAPPER_HEADER_FORMAT.unpack(in_data)
+        )
 
         return cls(source_wport, destination_wport, length, version)
 
@@ -5,7 +5,7 @@ import attr
 # TODO: when using ciphered apdus we will get other apdus. (33 64) global or dedicated cipered iniitate requests
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, frozen=True)
 class Conformance:
     """
     Holds information about the supported services in a DLMS association.
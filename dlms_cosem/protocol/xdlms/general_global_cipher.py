@@ -6,7 +6,11 @@ import attr
 from dlms_cosem import a_xdr
 from dlms_cosem.dlms_data import OctetStringData
 from dlms_cosem.protocol.xdlms.base import AbstractXDlmsApdu
-from dlms_cosem.security import SecurityControlField, decrypt
+from dlms_cosem.security import (
+    INVOCATION_COUNTER_FORMAT,
+    SecurityControlField,
+    decrypt,
+)
 
 int_from_bytes = partial(int.from_bytes, "big")
 
@@ -58,10 +62,8 @@ class GeneralGlobalCipher(AbstractXDlmsApdu):
         in_dict = decoder.decode(data)
         system_title = in_dict["system_title"].value
         ciphered_content = in_dict["ciphered_content"].value
-        security_control = SecurityControlField.from_bytes(
-            ciphered_content.pop(0).to_bytes(1, "big")
-        )
-        invocation_counter = int.from_bytes(ciphered_content[:4], "big")
+        security_control = SecurityControlField.from_int(ciphered_content.pop(0))
+        (invocation_counter,) = INVOCATION_COUNTER_FORMAT.unpack_from(ciphered_content)
         ciphered_text = bytes(ciphered_content[4:])
         return cls(system_title, security_control, invocation_counter, ciphered_text)
 
@@ -73,15 +75,10 @@ class GeneralGlobalCipher(AbstractXDlmsApdu):
             out.extend(self.system_title)
         else:
             out.extend(b"\x00")
-        out.append(
-            len(
-                self.security_control.to_bytes()
-                + self.invocation_counter.to_bytes(4, "big")
-                + self.ciphered_text
-            )
-        )
+        # security control (1 byte) + invocation counter (4 bytes) + ciphered text
+        out.append(5 + len(self.ciphered_text))
         out.extend(self.security_control.to_bytes())
-        out.extend(self.invocation_counter.to_bytes(4, "big"))
+        out.extend(INVOCATION_COUNTER_FORMAT.pack(self.invocation_counter))
         out.extend(self.ciphered_text)
         return bytes(out)
 
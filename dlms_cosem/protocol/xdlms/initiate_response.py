@@ -50,8 +50,10 @@ class InitiateResponse(AbstractXDlmsApdu):
 
         conformance_tag_and_length = data[:3]
         if conformance_tag_and_length != b"\x5f\x1f\x04":
-            print(conformance_tag_and_length)
-            raise ValueError("Not correct conformance tag and length")
+            raise ValueError(
+                f"Not correct conformance tag and length: "
+                f"{bytes(conformance_tag_and_length)!r}"
+            )
 
         conformance = Conformance.from_bytes(data[3:-2])
 
@@ -95,10 +97,8 @@ class GlobalCipherInitiateResponse(AbstractXDlmsApdu):
         if length != len(data):
             raise ValueError(f"Octetstring is not of correct length")
 
-        security_control = security.SecurityControlField.from_bytes(
-            data.pop(0).to_bytes(1, "big")
-        )
-        invocation_counter = int.from_bytes(data[:4], "big")
+        security_control = security.SecurityControlField.from_int(data.pop(0))
+        (invocation_counter,) = security.INVOCATION_COUNTER_FORMAT.unpack_from(data)
         ciphered_text = bytes(data[4:])
 
         return cls(security_control, invocation_counter, ciphered_text)
@@ -109,7 +109,9 @@ class GlobalCipherInitiateResponse(AbstractXDlmsApdu):
 
         octet_string_data = bytearray()
         octet_string_data.extend(self.security_control.to_bytes())
-        octet_string_data.extend(self.invocation_counter.to_bytes(4, "big"))
+        octet_string_data.extend(
+            security.INVOCATION_COUNTER_FORMAT.pack(self.invocation_counter)
+        )
         octet_string_data.extend(self.ciphered_text)
         out.append(len(octet_string_data))
         out.extend(octet_string_data)
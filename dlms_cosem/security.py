@@ -1,12 +1,16 @@
 from __future__ import annotations  # noqa
 
+import functools
+import hmac
 import os
+import struct
 from typing import Optional, ClassVar
 
 
 import attr
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.keywrap import aes_key_unwrap, aes_key_wrap
 
 from dlms_cosem import enumerations, exceptions
@@ -41,6 +45,10 @@ The initialization vector is essentially a nonce. In DLMS/COSEM it is
 """
 
 TAG_LENGTH = 12
+# Tag length AES-GCM produces before it is truncated.
+FULL_TAG_LENGTH = 16
+# The invocation counter is a 4 byte unsigned integer, big endian.
+INVOCATION_COUNTER_FORMAT = struct.Struct(">I")
 
 
 def validate_security_suite_number(instance, attribute, value):
@@ -48,7 +56,7 @@ def validate_security_suite_number(instance, attribute, value):
         raise ValueError(f"Only Security Suite 0-2 is valid, Got: {value}")
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, frozen=True)
 class SecurityControlField:
     """
     8 bit unsigned integer
@@ -72,10 +80,19 @@ class SecurityControlField:
     encrypted: bool = attr.ib(default=False)
     broadcast_key: bool = attr.ib(default=False)
     compressed: bool = attr.ib(default=False)
+    # The field is immutable so it is encoded once and reused as part of the
+    # associated data on every encryption.
+    _encoded: bytes = attr.ib(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self):
+        object.__setattr__(self, "_encoded", self._encode())
 
     @classmethod
     def from_bytes(cls, source_bytes: bytes):
-        val = int.from_bytes(source_bytes, "big")  # just one byte.
+        return cls.from_int(int.from_bytes(source_bytes, "big"))  # just one byte.
+
+    @classmethod
+    def from_int(cls, val: int):
         _security_suite = val & 0b00001111
         _authenticated = bool(val & 0b00010000)
         _encrypted = bool(val & 0b00100000)
@@ -84,6 +101,9 @@ class SecurityControlField:
         return cls(_security_suite, _authenticated, _encrypted, _key_set, _compressed)
 
     def to_bytes(self):
+        return self._encoded
+
+    def _encode(self) -> bytes:
         _byte = self.security_suite
         if self.authenticated:
             _byte += 0b00010000
@@ -97,6 +117,23 @@ class SecurityControlField:
         return _byte.to_bytes(1, "big")
 
 
+@functools.lru_cache(maxsize=None)
+def make_security_control_field(
+    security_suite: int, encrypted: bool, authenticated: bool
+) -> SecurityControlField:
+    """
+    There are only a few possible security control fields. The field is immutable so
+    the same instance can be used by every connection. Keying on the values also
+    means a change of keys on the connection gives the right field.
+    """
+    return SecurityControlField(
+        security_suite,
+        encrypted=encrypted,
+        authenticated=authenticated,
+        broadcast_key=False,
+    )
+
+
 def validate_key(suite: int, key: bytes) -> None:
     key_lengths = {0: 16, 1: 16, 2: 32}
     if len(key) != key_lengths[suite]:
@@ -118,9 +155,13 @@ def encrypt(
     key: bytes,
     plain_text: bytes,
     auth_key: bytes,
+    cipher: Optional[AESGCM] = None,
 ) -> bytes:
     """
     Encrypts bytes according the to security context.
+
+    A cipher already set up with `key` can be passed in to not set up the key again
+    on every call.
     """
 
     if not security_control.encrypted and not security_control.authenticated:
@@ -131,33 +172,23 @@ def encrypt(
 
     # initialization vector is 12 bytes long and consists of the system_title (8 bytes)
     # and invocation_counter (4 bytes)
-    iv = system_title + invocation_counter.to_bytes(4, "big")
+    iv = system_title + INVOCATION_COUNTER_FORMAT.pack(invocation_counter)
 
     # Making sure the keys are of correct length for specified security suite
     validate_key(security_control.security_suite, key)
     validate_key(security_control.security_suite, auth_key)
 
-    # Construct an AES-GCM Cipher object with the given key and iv. Allow for
-    # truncating the auth tag
-    encryptor = Cipher(
-        algorithms.AES(key),
-        modes.GCM(initialization_vector=iv, tag=None, min_tag_length=TAG_LENGTH),
-    ).encryptor()
-
     # associated_data will be authenticated but not encrypted,
     # it must also be passed in on decryption.
     associated_data = security_control.to_bytes() + auth_key
-    encryptor.authenticate_additional_data(associated_data)
-
-    # Encrypt the plaintext and get the associated ciphertext.
-    # GCM does not require padding.
-    ciphertext = encryptor.update(plain_text) + encryptor.finalize()
 
-    # dlms uses a tag lenght of 12 not the default of 16. Since we have set the minimum
-    # tag length to 12 it is ok to truncated the tag down to 12 bytes.
-    tag = encryptor.tag[:TAG_LENGTH]
-
-    return ciphertext + tag
+    # AESGCM encrypts and authenticates in one call. GCM does not require padding.
+    # It returns the ciphertext followed by a full 16 byte tag. dlms uses a tag
+    # length of 12, and a GCM tag can be truncated, so the last bytes are dropped.
+    if cipher is None:
+        cipher = AESGCM(key)
+    ciphertext_and_tag = cipher.encrypt(iv, plain_text, associated_data)
+    return ciphertext_and_tag[: len(ciphertext_and_tag) - FULL_TAG_LENGTH + TAG_LENGTH]
 
 
 def decrypt(
@@ -179,7 +210,7 @@ def decrypt(
 
     # initialization vector is 12 bytes long and consists of the system_title (8 bytes)
     # and invocation_counter (4 bytes)
-    iv = system_title + invocation_counter.to_bytes(4, "big")
+    iv = system_title + INVOCATION_COUNTER_FORMAT.pack(invocation_counter)
 
     # Making sure the keys are of correct length for specified security suite
     validate_key(security_control.security_suite, key)
@@ -237,32 +268,19 @@ def gmac(
 
     # initialization vector is 12 bytes long and consists of the system_title (8 bytes)
     # and invocation_counter (4 bytes)
-    iv = system_title + invocation_counter.to_bytes(4, "big")
+    iv = system_title + INVOCATION_COUNTER_FORMAT.pack(invocation_counter)
 
     # Making sure the keys are of correct length for specified security suite
     validate_key(security_control.security_suite, key)
     validate_key(security_control.security_suite, auth_key)
 
-    # Construct an AES-GCM Cipher object with the given key and iv
-    encryptor = Cipher(
-        algorithms.AES(key),
-        modes.GCM(initialization_vector=iv, tag=None, min_tag_length=TAG_LENGTH),
-    ).encryptor()
-
     # associated_data will be authenticated but not encrypted,
     # so we put all data in the associated data.
     associated_data = security_control.to_bytes() + auth_key + challenge
-    encryptor.authenticate_additional_data(associated_data)
 
-    # Making sure to add an empty byte string as input. Then it will only be the
-    # associated_data that will be authenticated.
-    ciphertext = encryptor.update(b"") + encryptor.finalize()
-
-    # We want the tag as it is the authenticated data. Need to truncated it first
-    tag = encryptor.tag[:TAG_LENGTH]
-
-    # ciphertext is really b"" here.
-    return ciphertext + tag
+    # With an empty plain text only the associated_data is authenticated and the
+    # result is only the tag. We want the tag truncated to the dlms tag length.
+    return AESGCM(key).encrypt(iv, b"", associated_data)[:TAG_LENGTH]
 
 
 def wrap_key(
@@ -401,10 +419,8 @@ class HighLevelSecurityGmacAuthentication:
             raise ProtectionError(
                 "Unable to create GMAC. Missing global_authentication_key"
             )
-        only_auth_security_control = SecurityControlField(
-            security_suite=connection.security_suite,
-            authenticated=True,
-            encrypted=False,
+        only_auth_security_control = make_security_control_field(
+            connection.security_suite, False, True
         )
 
         gmac_result = gmac(
@@ -415,16 +431,18 @@ class HighLevelSecurityGmacAuthentication:
             auth_key=connection.global_authentication_key,
             challenge=connection.meter_to_client_challenge,
         )
-        return (
-            only_auth_security_control.to_bytes()
-            + connection.client_invocation_counter.to_bytes(4, "big")
-            + gmac_result
+        return b"".join(
+            (
+                only_auth_security_control.to_bytes(),
+                INVOCATION_COUNTER_FORMAT.pack(connection.client_invocation_counter),
+                gmac_result,
+            )
         )
 
     def hls_meter_data_is_valid(self, data: bytes, connection: DlmsConnection) -> bool:
-        security_control = SecurityControlField.from_bytes(data[0].to_bytes(1, "big"))
-        invocation_counter = int.from_bytes(data[1:5], "big")
-        gmac_result = data[-12:]
+        security_control = SecurityControlField.from_int(data[0])
+        (invocation_counter,) = INVOCATION_COUNTER_FORMAT.unpack_from(data, 1)
+        gmac_result = data[-TAG_LENGTH:]
 
         if not connection.global_encryption_key:
             raise ProtectionError(
@@ -447,7 +465,7 @@ class HighLevelSecurityGmacAuthentication:
             auth_key=connection.global_authentication_key,
             challenge=self.get_calling_authentication_value(),
         )
-        return gmac_result == correct_gmac
+        return hmac.compare_digest(gmac_result, correct_gmac)
 
 
 @attr.s(auto_attribs=True)
@@ -486,4 +504,4 @@ class HighLevelSecurityCommonAuthentication:
             encryptor.update(self.get_calling_authentication_value())
             + encryptor.finalize()
         )
-        return data == calculated_data
+        return hmac.compare_digest(data, calculated_data)
@@ -166,4 +166,4 @@ class DlmsConnectionState:
             )
         old_state = self.current_state
         self.current_state = new_state
-        LOG.debug(f"DLMS state transitioned", old_state=old_state, new_state=new_state)
+        LOG.debug("DLMS state transitioned", old_state=old_state, new_state=new_state)
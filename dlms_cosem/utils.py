@@ -4,12 +4,14 @@ from dlms_cosem import a_xdr, dlms_data
 from dlms_cosem.dlms_data import decode_variable_integer
 
 
+# The decoder keeps state between calls, so only the encoding conf is shared.
+DATA_ENCODING_CONF = a_xdr.EncodingConf(
+    attributes=[a_xdr.Sequence(attribute_name="data")]
+)
+
+
 def parse_as_dlms_data(data: bytes):
-    data_decoder = a_xdr.AXdrDecoder(
-        encoding_conf=a_xdr.EncodingConf(
-            attributes=[a_xdr.Sequence(attribute_name="data")]
-        )
-    )
+    data_decoder = a_xdr.AXdrDecoder(encoding_conf=DATA_ENCODING_CONF)
     return data_decoder.decode(data)["data"]
 
 
@@ -21,7 +23,6 @@ def parse_dlms_object(source_bytes: bytes) -> List[int]:
 
     But is seems they are always integers so we can parse them as a list of integers.
     """
-    values = list()
     data = bytearray(source_bytes)
     tag = data.pop(0)
     allowed_dlms_object_tags = [dlms_data.DataArray.TAG, dlms_data.DataStructure.TAG]
@@ -31,8 +32,10 @@ def parse_dlms_object(source_bytes: bytes) -> List[int]:
             f"with {dlms_data.DlmsDataFactory.get_data_class(tag)}"
         )
     length, rest = decode_variable_integer(data)
-    data = rest
-    for i in range(0, length):
-        values.append(data.pop(0))
-
-    return values
+    if len(rest) < length:
+        raise ValueError(
+            f"DLMS object should contain {length} items but only {len(rest)} bytes "
+            f"are left"
+        )
+    # Take all items at once instead of popping them off the front one by one.
+    return list(rest[:length])
@@ -1,4 +1,6 @@
 import socket
+import threading
+import time
 
 import pytest
 
@@ -71,3 +73,111 @@ class TestBlockingTcpTransport:
         transport.disconnect()
         transport.disconnect()
         assert transport.io.tcp_socket is None
+
+
+@pytest.fixture
+def socket_pair():
+    client, server = socket.socketpair()
+    with client, server:
+        yield client, server
+
+
+class TestBlockingTcpIO:
+    def test_recv_until(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000)
+        io.tcp_socket = client
+        server.sendall(b"\x7e\xa0\x07\x7e")
+        assert io.recv_until(b"\x7e") == b"\x7e"
+        assert io.recv_until(b"\x7e") == b"\xa0\x07\x7e"
+
+    def test_recv_on_closed_connection_raises(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000)
+        io.tcp_socket = client
+        server.sendall(b"\x7e\xa0")
+        server.shutdown(socket.SHUT_WR)
+        with pytest.raises(CommunicationError):
+            io.recv(4)
+
+    def test_recv_times_out_on_incomplete_data(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000, timeout=0.1)
+        io.tcp_socket = client
+        server.sendall(b"\x7e\xa0")
+        with pytest.raises(CommunicationError):
+            io.recv_until(b"\x7e\x7e")
+
+    def test_timeout_covers_whole_response_from_slow_peer(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000, timeout=0.3)
+        io.tcp_socket = client
+        stop = threading.Event()
+
+        def send_a_byte_at_a_time():
+            while not stop.is_set():
+                server.sendall(b"\xa0")
+                time.sleep(0.05)
+
+        sender = threading.Thread(target=send_a_byte_at_a_time)
+        sender.start()
+        try:
+            start = time.monotonic()
+            with pytest.raises(CommunicationError):
+                io.recv_until(b"\x7e")
+            assert time.monotonic() - start < 1
+        finally:
+            stop.set()
+            sender.join()
+        assert io.tcp_socket.gettimeout() == 0.3
+
+    def test_no_timeout_waits_for_data(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000, timeout=None)
+        io.tcp_socket = client
+        sender = threading.Timer(0.2, server.sendall, args=(b"\x7e\xa0\x7e",))
+        sender.start()
+        try:
+            assert io.recv_until(b"\x7e") == b"\x7e"
+            assert io.recv(2) == b"\xa0\x7e"
+        finally:
+            sender.join()
+        assert io.tcp_socket.gettimeout() is None
+
+    def test_data_after_end_is_kept_for_next_read(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000)
+        io.tcp_socket = client
+        server.sendall(b"\x7e\xa0\x07\x7e\x7e\xa0")
+        assert io.recv_until(b"\x7e") == b"\x7e"
+        assert io.recv_until(b"\x7e") == b"\xa0\x07\x7e"
+        assert io.recv(2) == b"\x7e\xa0"
+
+    def test_socket_options_are_set_on_connect(self):
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.bind(("localhost", 0))
+        server_socket.listen(1)
+        io = BlockingTcpIO(
+            host="localhost",
+            port=server_socket.getsockname()[1],
+            socket_options=[(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        io.connect()
+        assert io.tcp_socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        assert io.tcp_socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        io.disconnect()
+        server_socket.close()
+
+
+class TestTcpTransport:
+    def test_send_request_wraps_and_unwraps(self, socket_pair):
+        client, server = socket_pair
+        io = BlockingTcpIO(host="localhost", port=10000)
+        io.tcp_socket = client
+        transport = TcpTransport(
+            client_logical_address=16, server_logical_address=1, io=io
+        )
+        server.sendall(b"\x00\x01\x00\x01\x00\x10\x00\x02\xc4\x01")
+
+        assert transport.send_request(b"\xc0\x01") == b"\xc4\x01"
+        assert server.recv(100) == b"\x00\x01\x00\x10\x00\x01\x00\x02\xc0\x01"
@@ -1,6 +1,7 @@
+import attr
 import pytest
 
-from dlms_cosem import cosem
+from dlms_cosem import cosem, enumerations
 
 
 class TestObis:
@@ -33,6 +34,77 @@ class TestObis:
     def test_to_string(self):
         assert cosem.Obis.from_string("1-0:1.8.0.255").to_string() == "1-0:1.8.0.255"
 
-    def test_non_parsable_raises_value_error(self):
+    def test_is_slotted(self):
+        assert not hasattr(cosem.Obis(1, 0, 1, 8, 0), "__dict__")
+
+    def test_from_bytes_reuses_instances(self):
+        data = b"\x00\x00+\x01\x00\xff"
+        assert cosem.Obis.from_bytes(data) is cosem.Obis.from_bytes(data)
+
+    def test_is_immutable(self):
+        obis = cosem.Obis(1, 0, 1, 8, 0)
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            obis.a = 2
+
+    @pytest.mark.parametrize("values", [(256, 0, 1, 8, 0), (1, 0, 1, 8, 0, -1)])
+    def test_out_of_range_raises_value_error(self, values):
+        with pytest.raises(ValueError):
+            cosem.Obis(*values)
+
+    def test_non_int_raises_type_error(self):
+        with pytest.raises(TypeError):
+            cosem.Obis("1", 0, 1, 8, 0)
+
+    def test_obis_from_string_keeps_f(self):
+        assert cosem.Obis.from_string("0-0:96.1.0.100") == cosem.Obis(
+            0, 0, 96, 1, 0, 100
+        )
+
+    def test_digit_is_not_a_separator(self):
+        # Used to be accepted with the 2 taken as a separator between E and F.
+        with pytest.raises(ValueError):
+            cosem.Obis.from_string("1.0.1.8.0255")
+
+    @pytest.mark.parametrize("test_input", ["1.8.0", "1.0.1.8.0.255.1"])
+    def test_non_parsable_raises_value_error(self, test_input: str):
         with pytest.raises(ValueError):
-            cosem.Obis.from_string("1.8.0")
+            cosem.Obis.from_string(test_input)
+
+
+class TestCosemAttribute:
+    def test_from_bytes(self):
+        data = b"\x00\x08\x00\x00\x01\x00\x00\xff\x02"
+        assert cosem.CosemAttribute.from_bytes(data) == cosem.CosemAttribute(
+            interface=enumerations.CosemInterface.CLOCK,
+            instance=cosem.Obis(0, 0, 1, 0, 0, 255),
+            attribute=2,
+        )
+
+    def test_to_bytes(self):
+        attribute = cosem.CosemAttribute(
+            interface=enumerations.CosemInterface.CLOCK,
+            instance=cosem.Obis(0, 0, 1, 0, 0, 255),
+            attribute=2,
+        )
+        assert attribute.to_bytes() == b"\x00\x08\x00\x00\x01\x00\x00\xff\x02"
+
+    def test_wrong_length_raises_value_error(self):
+        with pytest.raises(ValueError):
+            cosem.CosemAttribute.from_bytes(b"\x00\x08\x00\x00\x01\x00\x00\xff")
+
+
+class TestCosemMethod:
+    def test_round_trip(self):
+        data = b"\x00\x0f\x00\x00\x28\x00\x00\xff\x01"
+        method = cosem.CosemMethod.from_bytes(data)
+        assert method.interface == enumerations.CosemInterface.ASSOCIATION_LN
+        assert method.method == 1
+        assert method.to_bytes() == data
+
+    def test_is_slotted(self):
+        method = cosem.CosemMethod(
+            interface=enumerations.CosemInterface.ASSOCIATION_LN,
+            instance=cosem.Obis(0, 0, 40, 0, 0, 255),
+            method=1,
+        )
+        assert not hasattr(method, "__dict__")
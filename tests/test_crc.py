@@ -0,0 +1,55 @@
+import binascii
+
+import pytest
+
+from dlms_cosem.crc import CRCCCITT, reverse_byte, reverse_byte_message
+
+
+class TestCrcCcitt:
+    @pytest.mark.parametrize(
+        "data,crc",
+        [
+            # CRC-16/X-25 check value is 0x906E. FCS is transmitted low byte first.
+            (b"123456789", b"\x6e\x90"),
+            (b"\xa0\x07\x21\x03\x73", b"\x01\x40"),
+            (b"", b"\x00\x00"),
+        ],
+    )
+    def test_calculate_for(self, data: bytes, crc: bytes):
+        assert CRCCCITT().calculate_for(data) == crc
+
+    def test_calculate_for_lsb_first(self):
+        assert CRCCCITT().calculate_for(b"123456789", lsb_first=True) == b"\x90\x6e"
+
+    def test_calculate_for_bytearray(self):
+        assert CRCCCITT().calculate_for(bytearray(b"123456789")) == b"\x6e\x90"
+
+    def test_crc_table_matches_crc_hqx(self):
+        assert len(CRCCCITT.crc_ccitt_table) == 256
+        for i, value in enumerate(CRCCCITT.crc_ccitt_table):
+            assert value == binascii.crc_hqx(bytes([i]), 0)
+
+    def test_init_crc_table_keeps_the_table(self):
+        table = CRCCCITT.crc_ccitt_table
+        CRCCCITT().init_crc_table()
+        assert CRCCCITT.crc_ccitt_table is table
+
+
+@pytest.mark.parametrize(
+    "byte,reversed_byte",
+    [
+        (0x00, b"\x00"),
+        (0x01, b"\x80"),
+        (0xA0, b"\x05"),
+        (0x7E, b"\x7e"),
+        (0xFF, b"\xff"),
+    ],
+)
+def test_reverse_byte(byte: int, reversed_byte: bytes):
+    assert reverse_byte(byte) == reversed_byte
+
+
+def test_reverse_byte_message():
+    assert reverse_byte_message(b"\x01\xa0\x7e") == b"\x80\x05\x7e"
+    assert reverse_byte_message(bytearray(b"\x01\xa0")) == b"\x80\x05"
+    assert reverse_byte_message(b"") == b""
@@ -67,6 +67,17 @@ def test_settings_exists_on_simple_init():
     assert c.settings is not None
 
 
+def test_connection_is_slotted():
+    c = DlmsConnection(
+        client_system_title=b"12345678",
+        authentication=NoSecurityAuthentication(),
+    )
+    assert not hasattr(c, "__dict__")
+    assert c.authentication_method is None
+    with pytest.raises(AttributeError):
+        c.not_an_attribute = True
+
+
 def test_settings_empty_system_title_in_general_glo_cipher_false(get_request: xdlms.GetRequestNormal):
     """
     Make sure that system_title is is used when protecting APDUs with default connection settings.
@@ -400,3 +411,62 @@ class TestMakeClientToServerChallenge:
     def test_too_long_length_raises_value_error(self):
         with pytest.raises(ValueError):
             make_client_to_server_challenge(65)
+
+
+def test_default_settings_are_not_shared_between_connections():
+    c1 = DlmsConnection(
+        client_system_title=b"12345678", authentication=NoSecurityAuthentication()
+    )
+    c2 = DlmsConnection(
+        client_system_title=b"12345678", authentication=NoSecurityAuthentication()
+    )
+    c1.settings.use_rlrq_rlre = False
+
+    assert c2.settings.use_rlrq_rlre
+
+
+def test_security_control_follows_the_keys():
+    c = DlmsConnection(
+        client_system_title=b"12345678", authentication=NoSecurityAuthentication()
+    )
+    assert not c.security_control.encrypted
+    assert not c.security_control.authenticated
+
+    c.global_encryption_key = b"1234567812345678"
+    c.global_authentication_key = b"1234567812345678"
+
+    assert c.security_control.encrypted
+    assert c.security_control.authenticated
+
+
+def test_global_cipher_is_reused_until_the_key_changes():
+    c = DlmsConnection(
+        client_system_title=b"12345678",
+        authentication=NoSecurityAuthentication(),
+        global_encryption_key=b"1234567812345678",
+        global_authentication_key=b"1234567812345678",
+    )
+    cipher = c.get_global_cipher()
+    assert c.get_global_cipher() is cipher
+
+    c.global_encryption_key = b"8765432187654321"
+    assert c.get_global_cipher() is not cipher
+
+
+def test_default_conformance_is_shared_between_connections():
+    c1 = DlmsConnection(
+        client_system_title=b"12345678",
+        authentication=NoSecurityAuthentication(),
+    )
+    c2 = DlmsConnection(
+        client_system_title=b"12345678",
+        authentication=NoSecurityAuthentication(),
+    )
+    protected = DlmsConnection(
+        client_system_title=b"12345678",
+        authentication=NoSecurityAuthentication(),
+        global_encryption_key=b"1111111111111111",
+    )
+    assert c1.conformance is c2.conformance
+    assert not c1.conformance.general_protection
+    assert protected.conformance.general_protection
@@ -1,6 +1,6 @@
 import pytest
 
-from dlms_cosem.utils import parse_as_dlms_data
+from dlms_cosem.utils import parse_as_dlms_data, parse_dlms_object
 from dlms_cosem import dlms_data
 
 def test_parse_data_from_kamstrup_han_port():
@@ -29,3 +29,34 @@ class TestVisibleString:
         obj = dlms_data.VisibleStringData(value=decoded)
 
         assert obj.to_bytes() == encoded
+
+
+@pytest.mark.parametrize(
+    "length,encoded",
+    [
+        (0, b"\x00"),
+        (127, b"\x7f"),
+        (128, b"\x81\x80"),
+        (255, b"\x81\xff"),
+        (256, b"\x82\x01\x00"),
+        (65536, b"\x83\x01\x00\x00"),
+    ],
+)
+def test_encode_variable_integer(length, encoded):
+    assert dlms_data.encode_variable_integer(length) == encoded
+    assert dlms_data.decode_variable_integer(encoded) == (length, b"")
+
+
+def test_long_octet_string_round_trip():
+    value = bytes(range(256)) * 2
+    encoded = dlms_data.OctetStringData(value).to_bytes()
+
+    assert encoded[:4] == b"\x09\x82\x02\x00"
+    assert parse_as_dlms_data(encoded) == value
+
+
+def test_parse_dlms_object():
+    assert parse_dlms_object(b"\x02\x03\x08\x00\x02") == [8, 0, 2]
+
+    with pytest.raises(ValueError):
+        parse_dlms_object(b"\x02\x03\x08\x00")
@@ -1,6 +1,7 @@
+import attr
 import pytest
 
-from dlms_cosem.hdlc import address, fields, frames
+from dlms_cosem.hdlc import address, fields, frames, state
 from dlms_cosem.hdlc.address import HdlcAddress
 from dlms_cosem.io import HdlcTransport
 
@@ -64,6 +65,57 @@ class TestHdlcAddress:
         )
         assert add.to_bytes() == resulting_bytes
 
+    @pytest.mark.parametrize(
+        "data,address_bytes,rest",
+        [
+            (b"\x03\x21\x93", b"\x03", b"\x21\x93"),
+            (b"\x02\x23\x21", b"\x02\x23", b"\x21"),
+            (b"\x00\x02\x00\x23\x73", b"\x00\x02\x00\x23", b"\x73"),
+        ],
+    )
+    def test_extract_address_bytes(self, data, address_bytes, rest):
+        assert address.HdlcAddress.extract_address_bytes(data) == (
+            address_bytes,
+            rest,
+        )
+
+    def test_extract_too_long_address_raises_value_error(self):
+        with pytest.raises(ValueError):
+            address.HdlcAddress.extract_address_bytes(b"\x00\x02\x00\x22\x73")
+
+    def test_address_is_immutable(self):
+        add = address.HdlcAddress(logical_address=1, address_type="server")
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            add.logical_address = 16
+
+    @pytest.mark.parametrize(
+        "logical_address,physical_address,address_type",
+        [
+            (128, None, "client"),
+            (-1, None, "client"),
+            (16384, None, "server"),
+            (1, 16384, "server"),
+            (1, -1, "server"),
+        ],
+    )
+    def test_out_of_range_address_raises_value_error(
+        self, logical_address, physical_address, address_type
+    ):
+        with pytest.raises(ValueError):
+            address.HdlcAddress(
+                logical_address=logical_address,
+                physical_address=physical_address,
+                address_type=address_type,
+            )
+
+        with attr.validators.disabled():
+            with pytest.raises(ValueError):
+                address.HdlcAddress(
+                    logical_address=logical_address,
+                    physical_address=physical_address,
+                    address_type=address_type,
+                )
+
     def test_find_4_byte_address(self):
         """
         Source address is using 4 bytes.
@@ -279,6 +331,143 @@ class TestFiorentiniLocal:
         # frame_content should be everything except flag and fcs
 
 
+class RecordingIO:
+    """
+    Keeps the sent data and returns the data in in_buffer as if it was received.
+    """
+
+    def __init__(self):
+        self.sent = list()
+        self.in_buffer = bytearray()
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    def recv_until(self, end: bytes) -> bytes:
+        position = self.in_buffer.index(end) + len(end)
+        data = bytes(self.in_buffer[:position])
+        del self.in_buffer[:position]
+        return data
+
+
+class TestHdlcTransport:
+    def test_encoded_control_frame_is_same_as_frame(self):
+        transport = HdlcTransport(
+            client_logical_address=16, server_logical_address=1, io=None
+        )
+        snrm = frames.SetNormalResponseModeFrame(
+            destination_address=transport.server_hdlc_address,
+            source_address=transport.client_hdlc_address,
+        )
+        assert (
+            transport.encoded_control_frame(frames.SetNormalResponseModeFrame)
+            == snrm.to_bytes()
+        )
+
+    def test_send_encoded_changes_state(self):
+        transport = HdlcTransport(
+            client_logical_address=16, server_logical_address=1, io=None
+        )
+        transport.hdlc_connection.send_encoded(
+            frames.SetNormalResponseModeFrame,
+            transport.encoded_control_frame(frames.SetNormalResponseModeFrame),
+        )
+        assert (
+            transport.hdlc_connection.state.current_state == state.AWAITING_CONNECTION
+        )
+
+    def test_send_request_asks_for_next_segment_with_receive_ready(self):
+        transport = HdlcTransport(
+            client_logical_address=16,
+            server_logical_address=1,
+            io=RecordingIO(),
+        )
+        transport.hdlc_connection.state.current_state = state.IDLE
+        first_segment = frames.InformationFrame(
+            destination_address=transport.client_hdlc_address,
+            source_address=transport.server_hdlc_address,
+            payload=b"\xe6\xe7\x00\x01",
+            send_sequence_number=0,
+            receive_sequence_number=1,
+            segmented=True,
+            final=True,
+        )
+        last_segment = frames.InformationFrame(
+            destination_address=transport.client_hdlc_address,
+            source_address=transport.server_hdlc_address,
+            payload=b"\x02",
+            send_sequence_number=1,
+            receive_sequence_number=1,
+            segmented=False,
+            final=True,
+        )
+        transport.io.in_buffer += first_segment.to_bytes() + last_segment.to_bytes()
+
+        assert transport.send_request(b"\xc0") == b"\x01\x02"
+
+        rr = frames.ReceiveReadyFrame(
+            destination_address=transport.server_hdlc_address,
+            source_address=transport.client_hdlc_address,
+            receive_sequence_number=1,
+        )
+        assert transport.io.sent[1] == rr.to_bytes()
+
+    def test_send_frame_sends_encoded_frame(self):
+        transport = HdlcTransport(
+            client_logical_address=16,
+            server_logical_address=1,
+            io=RecordingIO(),
+        )
+        transport.hdlc_connection.state.current_state = state.IDLE
+        frame = transport.generate_information_frame(
+            b"\xe6\xe6\x00\xc0", segmented=False, final=True
+        )
+
+        transport.send_frame(frame)
+
+        assert transport.io.sent == [frame.to_bytes()]
+        assert transport.hdlc_connection.state.current_state == state.AWAITING_RESPONSE
+        assert transport.hdlc_connection.server_ssn == 1
+
+    def test_addresses_are_created_once(self):
+        transport = HdlcTransport(
+            client_logical_address=16,
+            server_logical_address=1,
+            io=None,
+            server_physical_address=17,
+        )
+        assert transport.server_hdlc_address is transport.server_hdlc_address
+        assert transport.server_hdlc_address == HdlcAddress(
+            logical_address=1, physical_address=17, address_type="server"
+        )
+        assert transport.client_hdlc_address == HdlcAddress(
+            logical_address=16, address_type="client"
+        )
+
+    @pytest.mark.parametrize(
+        "field",
+        [
+            "client_logical_address",
+            "server_logical_address",
+            "server_physical_address",
+            "client_physical_address",
+            "extended_addressing",
+        ],
+    )
+    def test_address_fields_can_not_be_changed(self, field: str):
+        transport = HdlcTransport(
+            client_logical_address=16, server_logical_address=1, io=None
+        )
+        with pytest.raises(attr.exceptions.FrozenAttributeError):
+            setattr(transport, field, 2)
+        assert transport.server_hdlc_address == HdlcAddress(
+            logical_address=1, address_type="server"
+        )
+        assert transport.client_hdlc_address == HdlcAddress(
+            logical_address=16, address_type="client"
+        )
+
+
 # class TestKaifaMeter:
 #
 #     def test_kaifa_data(self):
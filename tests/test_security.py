@@ -1,7 +1,13 @@
 from cryptography.hazmat.primitives.ciphers import algorithms, modes
 from cryptography.hazmat.primitives.ciphers.base import Cipher
 
-from dlms_cosem.security import SecurityControlField, decrypt, encrypt, gmac
+from dlms_cosem.security import (
+    SecurityControlField,
+    decrypt,
+    encrypt,
+    gmac,
+    make_security_control_field,
+)
 
 
 def test_encrypt():
@@ -159,3 +165,19 @@ def test_gmac2():
     result = ciphertext + tag
 
     assert result == bytes.fromhex("1A52FE7DD3E72748973C1E28")
+
+
+def test_security_control_field_from_int_matches_from_bytes():
+    for value in (0x00, 0x10, 0x20, 0x30, 0x31, 0x72, 0xB2):
+        assert SecurityControlField.from_int(value) == SecurityControlField.from_bytes(
+            bytes([value])
+        )
+        assert SecurityControlField.from_int(value).to_bytes() == bytes([value])
+
+
+def test_make_security_control_field_reuses_instances():
+    field = make_security_control_field(0, False, True)
+    assert field is make_security_control_field(0, False, True)
+    assert field == SecurityControlField(
+        security_suite=0, authenticated=True, encrypted=False
+    )
@@ -0,0 +1,70 @@
+import pytest
+
+from dlms_cosem.io import SerialIO
+
+
+class FakeSerial:
+    """
+    Returns the data in the chunks it was given, like bytes arriving on a port.
+    """
+
+    def __init__(self, *chunks: bytes):
+        self.chunks = list(chunks)
+        self.reads = 0
+
+    @property
+    def in_waiting(self) -> int:
+        if self.chunks:
+            return len(self.chunks[0])
+        return 0
+
+    def read(self, size: int = 1) -> bytes:
+        self.reads += 1
+        if not self.chunks:
+            return b""
+        chunk = self.chunks.pop(0)
+        if len(chunk) > size:
+            self.chunks.insert(0, chunk[size:])
+        return chunk[:size]
+
+    def close(self):
+        pass
+
+
+class TestSerialIO:
+    def test_recv_until_reads_available_bytes_at_once(self):
+        io = SerialIO(port_name="test")
+        io.serial_port = FakeSerial(b"\x7e\xa0\x07\x21\x03\x73\x01\x40\x7e")
+        assert io.recv_until(b"\x7e") == b"\x7e"
+        assert io.recv_until(b"\x7e") == b"\xa0\x07\x21\x03\x73\x01\x40\x7e"
+        assert io.serial_port.reads == 1
+
+    def test_recv_until_over_several_reads(self):
+        io = SerialIO(port_name="test")
+        io.serial_port = FakeSerial(b"\x7e\xa0", b"\x07\x21", b"\x7e\x7e\xa0")
+        assert io.recv_until(b"\x7e") == b"\x7e"
+        assert io.recv_until(b"\x7e") == b"\xa0\x07\x21\x7e"
+        # data after the end is kept for the next read
+        assert io.recv(2) == b"\x7e\xa0"
+
+    def test_recv_until_finds_end_split_over_reads(self):
+        io = SerialIO(port_name="test")
+        io.serial_port = FakeSerial(b"\x01\x02\x0d", b"\x0a\x03")
+        assert io.recv_until(b"\x0d\x0a") == b"\x01\x02\x0d\x0a"
+        assert io.recv(1) == b"\x03"
+
+    def test_recv_until_returns_received_data_on_timeout(self):
+        io = SerialIO(port_name="test")
+        io.serial_port = FakeSerial(b"\xa0\x07")
+        assert io.recv_until(b"\x7e") == b"\xa0\x07"
+
+    def test_recv_until_timeout_covers_the_whole_call(self):
+        io = SerialIO(port_name="test", timeout=0)
+        io.serial_port = FakeSerial(b"\xa0", b"\x07", b"\x7e")
+        assert io.recv_until(b"\x7e") == b"\xa0"
+        assert io.recv_until(b"\x7e") == b"\x07"
+
+    def test_recv_on_closed_port_raises(self):
+        io = SerialIO(port_name="test")
+        with pytest.raises(RuntimeError):
+            io.recv_until(b"\x7e")